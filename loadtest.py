@@ -0,0 +1,548 @@
+# Imports necessários
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from importlib.metadata import version
+from pathlib import Path
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# --- Configurações Iniciais e Funções Auxiliares ---
+
+APP_PATH = Path(__file__).resolve().parent / "app.py"
+
+# Faixa fixa de datas de nascimento, para que a mesma semente gere as mesmas
+# datas em qualquer dia e os relatórios continuem comparáveis
+FIRST_BIRTH_DATE = datetime.date(1900, 1, 1)
+LAST_BIRTH_DATE = datetime.date(2020, 12, 31)
+
+# Nomes realistas (com acentos, hífens, apóstrofos e partículas) para simular usuários
+sample_names = [
+    "Maria Joaquina de Amaral Pereira Góis",
+    "Marcos Antonio Inoue Rosa",
+    "João Pedro da Silva",
+    "Ana Clara Souza Lima",
+    "José Carlos de Oliveira Santos",
+    "Luíza Helena Ferreira Costa",
+    "Francisco das Chagas Rodrigues",
+    "Beatriz Akemi Tanaka",
+    "Antônio Conceição Araújo Neto",
+    "Júlia Müller Schmidt",
+    "Pedro Henrique Gonçalves Albuquerque",
+    "Ana-Luísa D'Ávila Barbosa",
+    "Raimundo Nonato Cavalcanti",
+    "Letícia Yumi Nakamura Ribeiro",
+    "Carlos Eduardo Magalhães de Menezes Brandão",
+]
+
+# Abas esperadas após um envio bem-sucedido. No Streamlit a troca de abas
+# acontece no navegador, sem rerun: o servidor envia todas as abas em cada
+# envio, então aqui apenas conferimos que cada uma chegou com conteúdo.
+tab_labels = ["📊 Números Principais", "🔄 Ciclos e Desafios", "🌉 Números de Ponte", "✨ Aspectos Cármicos", "📋 Resumo Completo"]
+
+
+def random_birth_date(rng, feb_29_rate=0.0):
+    """Sorteia uma data de nascimento na faixa fixa.
+
+    29/02 só aparece na fração `feb_29_rate` dos sorteios: o app falha com essa
+    data em anos não bissextos, e o resultado mudaria conforme o ano corrente."""
+    if rng.random() < feb_29_rate:
+        year = rng.choice([y for y in range(FIRST_BIRTH_DATE.year, LAST_BIRTH_DATE.year + 1) if y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)])
+        return datetime.date(year, 2, 29)
+    while True:
+        birth_date = datetime.date.fromordinal(rng.randint(FIRST_BIRTH_DATE.toordinal(), LAST_BIRTH_DATE.toordinal()))
+        if (birth_date.month, birth_date.day) != (2, 29):
+            return birth_date
+
+
+def percentile(values, pct):
+    """Percentil pelo método do rank mais próximo (0 se a lista estiver vazia)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_stats(values):
+    """Resumo de latências em milissegundos."""
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p95_ms': round(percentile(values, 95) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(max(values) * 1000, 3) if values else 0.0,
+    }
+
+
+def process_rss_mb(pid):
+    """RSS atual do processo em MB via /proc, ou None fora do Linux."""
+    try:
+        fields = dict(line.split(":", 1) for line in Path(f"/proc/{pid}/status").read_text().splitlines() if ":" in line)
+        return int(fields['VmRSS'].split()[0]) / 1024
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def process_cpu_seconds(pid):
+    """Tempo de CPU (usuário + sistema) do processo via /proc, ou None fora do Linux."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+        # O nome do processo pode conter espaços; os campos vêm depois do ')'
+        fields = stat.rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def round_or_none(value, digits=1):
+    return round(value, digits) if value is not None else None
+
+
+# --- Servidor Streamlit ---
+
+def free_port():
+    """Reserva uma porta TCP livre na máquina local."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, timeout):
+    """Inicia `streamlit run app.py` em segundo plano e espera o health check responder."""
+    log = tempfile.TemporaryFile()
+    command = [
+        sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    server = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f"O servidor encerrou com código {server.returncode}:\n{log.read().decode(errors='replace')}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    stop_server(server)
+    raise RuntimeError(f"O servidor não respondeu em {timeout}s.")
+
+
+def stop_server(server):
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+# --- Sessão Simulada ---
+
+class SimulatedSession:
+    """Uma aba de navegador conectada ao servidor pelo websocket do Streamlit."""
+
+    def __init__(self, session_id, url, timeout):
+        self.session_id = session_id
+        self.url = url
+        self.timeout = timeout
+        self.ws = None
+        self.page_script_hash = ""
+        self.widget_ids = {}
+        self.date_format = "%Y-%m-%d"
+
+    async def connect(self):
+        """Abre o websocket e faz o carregamento inicial da página; retorna a latência."""
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None, open_timeout=self.timeout)
+        t0 = time.perf_counter()
+        messages = await self.rerun([])
+        latency = time.perf_counter() - t0
+        for message in messages:
+            if message.WhichOneof("type") == "new_session":
+                self.page_script_hash = message.new_session.page_script_hash
+            element = self._element(message)
+            if element is None:
+                continue
+            kind = element.WhichOneof("type")
+            if kind in ("text_input", "date_input", "button"):
+                self.widget_ids[kind] = getattr(element, kind).id
+            if kind == "date_input" and "/" in element.date_input.min:
+                # Versões antigas do Streamlit serializam datas como AAAA/MM/DD
+                self.date_format = "%Y/%m/%d"
+        missing = {"text_input", "date_input", "button"} - set(self.widget_ids)
+        if missing:
+            raise RuntimeError(f"Widgets do formulário não encontrados: {', '.join(sorted(missing))}")
+        return latency
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self, widgets):
+        """Envia um rerun com o estado dos widgets e coleta as mensagens até o fim do script."""
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page_script_hash
+        msg.rerun_script.widget_states.widgets.extend(widgets)
+        await self.ws.send(msg.SerializeToString())
+        return await asyncio.wait_for(self._collect(), timeout=self.timeout)
+
+    async def _collect(self):
+        messages = []
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(await self.ws.recv())
+            messages.append(message)
+            if message.WhichOneof("type") == "script_finished":
+                return messages
+
+    async def submit(self, name, birth_date):
+        """Preenche o formulário e envia; retorna (latência, mensagem de erro ou None)."""
+        widgets = [
+            WidgetState(id=self.widget_ids['text_input'], string_value=name),
+            WidgetState(id=self.widget_ids['date_input']),
+            WidgetState(id=self.widget_ids['button'], trigger_value=True),
+        ]
+        widgets[1].string_array_value.data.append(birth_date.strftime(self.date_format))
+        t0 = time.perf_counter()
+        messages = await self.rerun(widgets)
+        latency = time.perf_counter() - t0
+        return latency, self._check_results(messages)
+
+    @staticmethod
+    def _element(message):
+        if message.WhichOneof("type") == "delta" and message.delta.WhichOneof("type") == "new_element":
+            return message.delta.new_element
+        return None
+
+    def _check_results(self, messages):
+        """Procura erros exibidos pelo app e confere se todas as abas vieram com conteúdo."""
+        tabs = {}
+        paths = []
+        for message in messages:
+            if message.WhichOneof("type") != "delta":
+                continue
+            path = tuple(message.metadata.delta_path)
+            paths.append(path)
+            delta = message.delta
+            if delta.WhichOneof("type") == "add_block" and delta.add_block.WhichOneof("type") == "tab":
+                tabs[delta.add_block.tab.label] = path
+            element = self._element(message)
+            if element is None:
+                continue
+            kind = element.WhichOneof("type")
+            if kind == "exception":
+                return f"Exceção: {element.exception.message}"
+            if kind == "alert" and element.alert.format == element.alert.ERROR:
+                return element.alert.body
+        for label in tab_labels:
+            tab_path = tabs.get(label)
+            if tab_path is None or not any(len(p) > len(tab_path) and p[:len(tab_path)] == tab_path for p in paths):
+                return f"Aba ausente ou vazia: {label}"
+        return None
+
+
+# Falhas que interrompem apenas a sessão afetada (servidor sobrecarregado, conexão caída, timeout)
+session_errors = (OSError, TimeoutError, asyncio.TimeoutError, RuntimeError, websockets.WebSocketException)
+
+
+def describe_error(e):
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+
+async def warm_up(session, config, rng, result):
+    """Carrega a página e faz um envio de aquecimento, que fica fora das métricas."""
+    result['load_latency'] = await session.connect()
+    await session.submit(rng.choice(sample_names), random_birth_date(rng, config['feb_29_rate']))
+
+
+async def simulate(session, config, rng, start, result):
+    """Repete o ciclo preencher → enviar → conferir abas `config['iterations']` vezes."""
+    await start.wait()
+    result['started_at'] = time.perf_counter()
+    for iteration in range(config['iterations']):
+        name = rng.choice(sample_names)
+        birth_date = random_birth_date(rng, config['feb_29_rate'])
+        latency, error = await session.submit(name, birth_date)
+        if error is None:
+            result['submit_latencies'].append(latency)
+        else:
+            # Envios com erro são rápidos (o app pula as abas) e distorceriam os percentis
+            result['errors'].append({'name': name, 'birth_date': birth_date.isoformat(), 'message': error})
+        # Sem pausa após o último envio, para não inflar o tempo total
+        if config['think_time'] > 0 and iteration < config['iterations'] - 1:
+            await asyncio.sleep(rng.uniform(0, 2 * config['think_time']))
+    result['finished_at'] = time.perf_counter()
+
+
+# --- Execução e Relatório ---
+
+async def track_peak_rss(server_pid, peak, interval=0.05):
+    """Amostra o RSS do servidor durante o teste e guarda o maior valor em `peak['mb']`."""
+    while True:
+        rss = process_rss_mb(server_pid)
+        if rss is not None and (peak['mb'] is None or rss > peak['mb']):
+            peak['mb'] = rss
+        await asyncio.sleep(interval)
+
+
+async def run_sessions(config, url, server_pid):
+    """Conecta e aquece as sessões uma a uma, mede a memória do servidor e dispara todas ao mesmo tempo.
+
+    Uma sessão que falha ao conectar ou durante o teste é marcada como `fatal`;
+    as demais continuam, já que falhas sob carga fazem parte do que se mede."""
+    sessions = [SimulatedSession(i, url, config['timeout']) for i in range(config['sessions'])]
+    results = [{'session': i, 'submit_latencies': [], 'errors': []} for i in range(config['sessions'])]
+    rngs = [random.Random(config['seed'] + i) for i in range(config['sessions'])]
+    sample_memory = (lambda: process_rss_mb(server_pid)) if server_pid else (lambda: None)
+    active = []
+    rss_one = rss_all = rss_end = None
+    peak = {'mb': None}
+    try:
+        for session, result, rng in zip(sessions, results, rngs):
+            try:
+                await warm_up(session, config, rng, result)
+            except session_errors as e:
+                result['fatal'] = describe_error(e)
+                continue
+            active.append((session, result, rng))
+            if len(active) == 1:
+                rss_one = sample_memory()
+        rss_all = sample_memory()
+
+        start = asyncio.Event()
+        cpu_start = process_cpu_seconds(server_pid) if server_pid else None
+        tracker = asyncio.create_task(track_peak_rss(server_pid, peak)) if server_pid else None
+        tasks = [asyncio.create_task(simulate(s, config, rng, start, r)) for s, r, rng in active]
+        start.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        cpu_end = process_cpu_seconds(server_pid) if server_pid else None
+        rss_end = sample_memory()
+        if tracker is not None:
+            tracker.cancel()
+    finally:
+        await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+    for (_, result, _), outcome in zip(active, outcomes):
+        if isinstance(outcome, BaseException):
+            result['fatal'] = describe_error(outcome)
+
+    # Aquecer as sessões uma a uma quase não muda o RSS; o custo aparece quando elas
+    # rodam ao mesmo tempo. Por sessão: (pico com N sessões ativas − RSS com 1 sessão aquecida) / (N − 1)
+    rss_peak = max((v for v in (peak['mb'], rss_end) if v is not None), default=None)
+    per_session = (rss_peak - rss_one) / (len(active) - 1) if len(active) > 1 and rss_one is not None and rss_peak is not None else None
+    server = {
+        'cpu_seconds': cpu_end - cpu_start if cpu_start is not None and cpu_end is not None else None,
+        'rss_per_session_mb': per_session,
+        'rss_growth_mb': rss_end - rss_all if rss_end is not None and rss_all is not None else None,
+        'rss_peak_mb': rss_peak,
+    }
+    return results, server
+
+
+def run_load_test(config, url=None, server_pid=None):
+    """Executa o teste contra um servidor existente (`url`) ou contra um iniciado aqui."""
+    server = None
+    if url is None:
+        port = free_port()
+        server = start_server(port, config['timeout'])
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        server_pid = server.pid
+    try:
+        sessions, server_stats = asyncio.run(run_sessions(config, url, server_pid))
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f"O servidor encerrou durante o teste com código {server.returncode}.")
+    finally:
+        if server is not None:
+            stop_server(server)
+    return build_report(config, sessions, server_stats)
+
+
+def build_report(config, sessions, server_stats):
+    """Consolida as métricas das sessões e do servidor em um relatório JSON."""
+    finished = [s for s in sessions if 'fatal' not in s]
+    # Latência e throughput usam só as sessões que terminaram, as mesmas do tempo total
+    submits = [lat for s in finished for lat in s['submit_latencies']]
+    errors = [dict(e, session=s['session']) for s in sessions for e in s['errors']]
+    attempts = sum(len(s['submit_latencies']) + len(s['errors']) for s in sessions)
+    wall = max(s['finished_at'] for s in finished) - min(s['started_at'] for s in finished) if finished else 0.0
+
+    # CPU dividida só pelas sessões que chegaram a rodar o teste
+    n = sum(1 for s in sessions if 'started_at' in s)
+    cpu = server_stats['cpu_seconds']
+
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'config': config,
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'streamlit': version("streamlit"),
+        },
+        'summary': {
+            'wall_seconds': round(wall, 3),
+            'submissions': attempts,
+            'errors': len(errors),
+            'fatal_sessions': len(sessions) - len(finished),
+            'throughput_rps': round(len(submits) / wall, 3) if wall > 0 else 0.0,
+            'submit': latency_stats(submits),
+            'page_load': latency_stats([s['load_latency'] for s in sessions if 'load_latency' in s]),
+            'server_cpu_seconds_per_session': round_or_none(cpu / n if cpu is not None and n else None, 3),
+            'server_cpu_ms_per_submission': round_or_none(cpu / attempts * 1000 if cpu is not None and attempts else None, 3),
+            'server_rss_peak_during_run_mb': round_or_none(server_stats['rss_peak_mb']),
+            'server_rss_mb_per_session': round_or_none(server_stats['rss_per_session_mb'], 2),
+            'server_rss_growth_during_run_mb': round_or_none(server_stats['rss_growth_mb']),
+        },
+        'sessions': [
+            {
+                'session': s['session'],
+                'submit': latency_stats(s['submit_latencies']),
+                'errors': len(s['errors']),
+                'fatal': s.get('fatal'),
+            }
+            for s in sessions
+        ],
+        'errors': errors[:20],
+    }
+
+
+def compare_with_baseline(report, baseline, tolerance):
+    """Compara com um relatório anterior; retorna a lista de regressões encontradas."""
+    regressions = []
+    current, previous = report['summary'], baseline['summary']
+    checks = [
+        ('submit.p50_ms', current['submit']['p50_ms'], previous['submit']['p50_ms'], True),
+        ('submit.p95_ms', current['submit']['p95_ms'], previous['submit']['p95_ms'], True),
+        ('submit.p99_ms', current['submit']['p99_ms'], previous['submit']['p99_ms'], True),
+        ('server_cpu_ms_per_submission', current['server_cpu_ms_per_submission'], previous['server_cpu_ms_per_submission'], True),
+        ('server_rss_peak_during_run_mb', current.get('server_rss_peak_during_run_mb'), previous.get('server_rss_peak_during_run_mb'), True),
+        ('throughput_rps', current['throughput_rps'], previous['throughput_rps'], False),
+    ]
+    print(f"\nComparação com baseline ({baseline['timestamp']}):")
+    for metric, now, before, lower_is_better in checks:
+        if now is None or before is None:
+            print(f"  {metric:<30} indisponível")
+            continue
+        change = (now - before) / before if before else 0.0
+        worse = change > tolerance if lower_is_better else change < -tolerance
+        flag = "  ⚠️ REGRESSÃO" if worse else ""
+        print(f"  {metric:<30} {before:>10} -> {now:>10} ({change:+.1%}){flag}")
+        if worse:
+            regressions.append(metric)
+
+    # Qualquer erro a mais é regressão: envios com erro ficam rápidos e mascarariam a latência
+    for metric in ('errors', 'fatal_sessions'):
+        now, before = current[metric], previous.get(metric, 0)
+        worse = now > before
+        flag = "  ⚠️ REGRESSÃO" if worse else ""
+        print(f"  {metric:<30} {before:>10} -> {now:>10}{flag}")
+        if worse:
+            regressions.append(metric)
+
+    if any(baseline['config'].get(key) != report['config'].get(key) for key in ('sessions', 'iterations', 'think_time', 'feb_29_rate', 'url')):
+        print("  Aviso: configuração diferente do baseline; comparação pode não ser válida.")
+    return regressions
+
+
+def format_value(value, unit):
+    return f"{value}{unit}" if value is not None else "n/d"
+
+
+def print_report(report):
+    """Exibe o resumo no terminal."""
+    summary = report['summary']
+    config = report['config']
+    print(f"Sessões concorrentes: {config['sessions']} | Envios por sessão: {config['iterations']}")
+    print(f"Envios: {summary['submissions']} em {summary['wall_seconds']}s | Erros: {summary['errors']} | Sessões interrompidas: {summary['fatal_sessions']}")
+    print(f"Throughput: {summary['throughput_rps']} envios/s (apenas envios sem erro)")
+    for key, label in [('submit', 'Envio + renderização'), ('page_load', 'Carregamento inicial')]:
+        stats = summary[key]
+        print(f"{label:<22} p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms")
+    print(f"CPU do servidor: {format_value(summary['server_cpu_seconds_per_session'], 's')} por sessão, "
+          f"{format_value(summary['server_cpu_ms_per_submission'], 'ms')} por envio")
+    print(f"Memória do servidor: {format_value(summary['server_rss_mb_per_session'], 'MB')} por sessão adicional (pico com todas ativas), "
+          f"pico durante o teste {format_value(summary['server_rss_peak_during_run_mb'], 'MB')}, "
+          f"crescimento durante o teste {format_value(summary['server_rss_growth_during_run_mb'], 'MB')}")
+    for session in report['sessions']:
+        if session['fatal']:
+            print(f"⚠️ Sessão {session['session']} interrompida: {session['fatal']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga da calculadora (app.py) com sessões simuladas concorrentes em uma única instância do servidor.")
+    parser.add_argument("--sessions", type=int, default=4, help="Número de sessões simultâneas (padrão: 4)")
+    parser.add_argument("--iterations", type=int, default=20, help="Envios do formulário por sessão (padrão: 20)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pausa média entre envios em segundos (padrão: 0)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Tempo máximo para iniciar o servidor e para cada execução do script, em segundos")
+    parser.add_argument("--feb-29-rate", type=float, default=0.0, help="Fração de datas 29/02 (padrão: 0; o app falha com elas em anos não bissextos)")
+    parser.add_argument("--seed", type=int, default=42, help="Semente para os nomes e datas sorteados")
+    parser.add_argument("--url", help="Websocket de um servidor já em execução (ex: ws://localhost:8501/_stcore/stream); por padrão inicia um servidor local")
+    parser.add_argument("--server-pid", type=int, help="PID do servidor indicado em --url, para medir CPU e memória")
+    parser.add_argument("--output", type=Path, help="Arquivo JSON para salvar o relatório")
+    parser.add_argument("--baseline", type=Path, help="Relatório JSON anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Variação tolerada antes de acusar regressão (padrão: 0.10)")
+    args = parser.parse_args(argv)
+
+    if args.sessions < 1 or args.iterations < 1:
+        parser.error("--sessions e --iterations devem ser pelo menos 1.")
+    if args.think_time < 0 or args.tolerance < 0:
+        parser.error("--think-time e --tolerance não podem ser negativos.")
+    if not 0 <= args.feb_29_rate <= 1:
+        parser.error("--feb-29-rate deve estar entre 0 e 1.")
+    if args.timeout <= 0:
+        parser.error("--timeout deve ser maior que zero.")
+    if args.server_pid is not None and args.url is None:
+        parser.error("--server-pid só faz sentido junto com --url.")
+
+    config = {
+        'sessions': args.sessions,
+        'iterations': args.iterations,
+        'think_time': args.think_time,
+        'timeout': args.timeout,
+        'seed': args.seed,
+        'feb_29_rate': args.feb_29_rate,
+        'url': args.url,
+    }
+    try:
+        report = run_load_test(config, url=args.url, server_pid=args.server_pid)
+    except (RuntimeError, OSError, TimeoutError, websockets.WebSocketException) as e:
+        print(f"❌ Não foi possível executar o teste de carga: {e}", file=sys.stderr)
+        return 1
+    print_report(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\nRelatório salvo em {args.output}")
+
+    exit_code = 1 if report['summary']['fatal_sessions'] else 0
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if compare_with_baseline(report, baseline, args.tolerance):
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())